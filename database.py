@@ -14,6 +14,31 @@ You'll edit this file in Tasks 2 and 3.
 import collections
 
 
+def bind(neos, approaches):
+    """Link together NEOs and their close approaches.
+
+    The close approaches are first grouped by the primary designation of their
+    NEO in a single pass, so each NEO gets its full collection of approaches in
+    one shot instead of growing it one approach at a time.
+
+    Close approaches whose NEO isn't in `neos` keep `None` as their `.neo`.
+
+    :param neos: A dictionary of `NearEarthObject`s with the primary designation as key.
+    :param approaches: A collection of `CloseApproach`es.
+    """
+    groups = {}
+    group = groups.setdefault
+    for approach in approaches:
+        group(approach._designation, []).append(approach)
+
+    for designation, group_approaches in groups.items():
+        neo = neos.get(designation)
+        if neo is not None:
+            neo.approaches = group_approaches
+            for approach in group_approaches:
+                approach.neo = neo
+
+
 class NEODatabase:
     """A database of near-Earth objects and their close approaches.
 
@@ -38,11 +63,12 @@ class NEODatabase:
         a collection of that NEO's close approaches, and the `.neo` attribute of
         each close approach references the appropriate NEO.
 
-        :param neos: A list of `NearEarthObject`s.
+        :param neos: A dictionary of `NearEarthObject`s with the primary designation as key.
         :param approaches: A list of `CloseApproach`es.
         """
-        self._neos = {neo.designation: neo for neo in neos}
-        self._approaches = [approache.assign_neo(self._neos) for approache in approaches]
+        self._neos = neos
+        self._approaches = list(approaches)
+        bind(self._neos, self._approaches)
 
     @property
     def _neos_by_name(self):
@@ -113,5 +139,4 @@ class NEODatabase:
             for f in filters:
                 approaches = filter(f, approaches)
 
-        for approach in approaches:
-            yield approach
+        yield from approaches
@@ -1,7 +1,8 @@
 """Extract data on near-Earth objects and close approaches from CSV and JSON files.
 
 The `load_neos` function extracts NEO data from a CSV file, formatted as
-described in the project instructions, into a collection of `NearEarthObject`s.
+described in the project instructions, into a dictionary of `NearEarthObject`s
+keyed by primary designation.
 
 The `load_approaches` function extracts close approach data from a JSON file,
 formatted as described in the project instructions, into a collection of
@@ -13,9 +14,16 @@ line, and uses the resulting collections to build an `NEODatabase`.
 You'll edit this file in Task 2.
 """
 import csv
+import itertools
 import json
+import operator
 import pathlib
 
+try:
+    import orjson  # Faster JSON parser, used when available.
+except ImportError:
+    orjson = None
+
 from models import NearEarthObject, CloseApproach
 
 
@@ -23,14 +31,15 @@ def load_neos(neo_csv_path=pathlib.Path('./data/neos.csv')):
     """Read near-Earth object information from a CSV file.
 
     :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
-    :return: A list of `NearEarthObject`s.
+    :return: A dictionary of `NearEarthObject`s with the primary designation as key.
     """
-    neos = []  # A better option: neos = {} (read EXTENSIONS.md)
     with open(neo_csv_path, 'r') as file:
-        reader = csv.DictReader(file)
-        for line in reader:
-            # neos={} ==> neos[line['pdes']] = NearEarthObject(**line)
-            neos.append(NearEarthObject(**line))
+        reader = csv.reader(file)
+        header = next(reader)
+        getter = operator.itemgetter(header.index('pdes'), header.index('name'),
+                                     header.index('diameter'), header.index('pha'))
+        neos = {neo.designation: neo
+                for neo in itertools.starmap(NearEarthObject, map(getter, reader))}
     return neos
 
 
@@ -40,7 +49,15 @@ def load_approaches(cad_json_path=pathlib.Path('./data/cad.json')):
     :param cad_json_path: A path to a JSON file containing data about close approaches.
     :return: A list of `CloseApproach`es.
     """
-    with open(cad_json_path, 'r') as file:
-        read = json.load(file)
-    appr = [CloseApproach(**dict(zip(read['fields'], data))) for data in read['data']]
+    if orjson is not None:
+        with open(cad_json_path, 'rb') as file:
+            read = orjson.loads(file.read())
+    else:
+        with open(cad_json_path, 'r') as file:
+            read = json.load(file)
+    fields = read['fields']
+    getter = operator.itemgetter(fields.index('des'), fields.index('cd'),
+                                 fields.index('dist'), fields.index('v_rel'))
+    # Pick the relevant columns of every row and build the objects in C-level loops.
+    appr = list(itertools.starmap(CloseApproach, map(getter, read['data'])))
     return appr
@@ -11,6 +11,23 @@ representations display seconds, but NASA's data (and our datetimes!) don't
 provide that level of resolution, so the output format also will not.
 """
 import datetime
+import re
+
+
+# The fixed shape of NASA's calendar dates: YYYY-bb-DD hh:mm.
+_CD_PATTERN = re.compile(r'[0-9]{4}-[A-Za-z]{3}-[0-9]{2} [0-9]{2}:[0-9]{2}')
+
+# English locale's month abbreviations, as used in the `cd` field, to month numbers.
+MONTHS = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+          'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
+
+# The same months as zero-padded ISO 8601 month strings.
+_ISO_MONTHS = {abbr: f'{month:02d}' for abbr, month in MONTHS.items()}
+
+# `datetime.fromisoformat` only exists in Python 3.7+. It accepts many more ISO 8601
+# variants (separators, seconds, time zones) than NASA's format, so it must only be
+# given calendar dates that already match `_CD_PATTERN`.
+_fromisoformat = getattr(datetime.datetime, 'fromisoformat', None)
 
 
 def cd_to_datetime(calendar_date):
@@ -23,10 +40,27 @@ def cd_to_datetime(calendar_date):
 
     This will become the Python object `datetime.datetime(2020, 12, 31, 12, 0)`.
 
+    The format is fixed-width, so once its shape is checked it's normalized to
+    ISO 8601 and parsed with the C-implemented `datetime.fromisoformat` (Python
+    3.7+), or sliced into fields directly on Python 3.6. Both are much faster
+    than `datetime.strptime`.
+
     :param calendar_date: A calendar date in YYYY-bb-DD hh:mm format.
     :return: A naive `datetime` corresponding to the given calendar date and time.
+    :raises ValueError: If the calendar date isn't in YYYY-bb-DD hh:mm format.
     """
-    return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
+    if not _CD_PATTERN.fullmatch(calendar_date):
+        raise ValueError(f"Calendar date {calendar_date!r} is not in YYYY-bb-DD hh:mm format.")
+    try:
+        if _fromisoformat is not None:
+            return _fromisoformat(calendar_date[:5] + _ISO_MONTHS[calendar_date[5:8]]
+                                  + calendar_date[8:])
+        return datetime.datetime(int(calendar_date[:4]), MONTHS[calendar_date[5:8]],
+                                 int(calendar_date[9:11]), int(calendar_date[12:14]),
+                                 int(calendar_date[15:17]))
+    except KeyError:
+        raise ValueError(f"Unknown month in calendar date {calendar_date!r}. "
+                         "Use YYYY-bb-DD hh:mm.") from None
 
 
 def datetime_to_str(dt):
@@ -17,9 +17,16 @@ quirks of the data set, such as missing names and unknown diameters.
 
 You'll edit this file in Task 1.
 """
+from math import isnan
+
 from helpers import cd_to_datetime, datetime_to_str
 
 
+# Header of the CSV serialization of a `CloseApproach`, in column order.
+CSV_FIELDNAMES = ('datetime_utc', 'distance_au', 'velocity_km_s', 'designation',
+                  'name', 'diameter_km', 'potentially_hazardous')
+
+
 class NearEarthObject:
     """A near-Earth object (NEO).
 
@@ -33,42 +40,34 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
-    def __init__(self, pdes, name='', diameter='', pha='N', **extra):
+    __slots__ = ('designation', 'name', 'fullname', 'diameter', 'hazardous', 'approaches')
+
+    def __init__(self, pdes, name='', diameter='', pha='N'):
         """Create a new `NearEarthObject`.
 
         :param pdes: A string with the primary designation of the NEO.
         :param name: A string with the International Astronomical Union (IAU) name of the NEO.
         :param diameter: A string with the NEO's diameter in kilometers. Empty string if unknown.
         :param pha: If the NEO is a 'Potentially Hazardous Asteroid'. Must be 'Y' or 'N' (string).
-        :param extra: Extra information about the NEO.
         """
-        self.designation = str(pdes)
-        self.name = str(name) or None
-
-        if not diameter:
-            diameter = 'nan'
-        self.diameter = float(diameter)
+        # The CSV reader always yields strings, so no `str` coercion is needed.
+        self.designation = pdes
+        self.name = name or None
+        # A representation of the full name of this NEO.
+        self.fullname = f'{pdes} ({name})' if name else pdes
+        self.diameter = float(diameter) if diameter else float('nan')
 
         if pha == 'N':
             pha = ''
         self.hazardous = bool(pha)
 
         self.approaches = []
-        self.extra_information = extra
-
-    @property
-    def fullname(self):
-        """Return a representation of the full name of this NEO."""
-        fullname = f'{self.designation}'
-        if self.name:
-            fullname += f' ({self.name})'
-        return fullname
 
     def __str__(self):
         """Return `str(self)`, a human-readable string representation of this object."""
         string = f'NEO {self.fullname!r}'
 
-        if self.diameter == self.diameter:  # False when self.diameter = nan
+        if not isnan(self.diameter):
             string += f' has a diameter of {self.diameter:.3f} km and'
 
         if self.hazardous:
@@ -98,36 +97,24 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
-    def __init__(self, des, cd, dist, v_rel, **extra):
+    __slots__ = ('_designation', 'time', 'time_str', 'distance', 'velocity', 'neo')
+
+    def __init__(self, des, cd, dist, v_rel):
         """Create a new `CloseApproach`.
 
-        :param des: Primary designation of the asteroid or comet.
+        :param des: Primary designation of the asteroid or comet (string).
         :param cd: Time of close-approach (formatted calendar date in 'YYYY-bb-DD hh:mm', in UTC).
         :param dist: Nominal approach distance (au).
         :param v_rel: Velocity relative to the approach body at close approach (km/s).
-        :param extra: Extra information about the Close Approach.
         """
-        self._designation = str(des)
+        # Every value in the CAD JSON data is a string, so only the numbers are converted.
+        self._designation = des
         self.time = cd_to_datetime(cd)
+        # Formatted once, without the seconds that the data set doesn't provide.
+        self.time_str = datetime_to_str(self.time)
         self.distance = float(dist)
         self.velocity = float(v_rel)
         self.neo = None
-        self.extra_information = extra
-
-    @property
-    def time_str(self):
-        """Return a formatted representation of this `CloseApproach`'s approach time.
-
-        The value in `self.time` should be a Python `datetime` object. While a
-        `datetime` object has a string representation, the default representation
-        includes seconds - significant figures that don't exist in our input
-        data set.
-
-        The `datetime_to_str` method converts a `datetime` object to a
-        formatted string that can be used in human-readable representations and
-        in serialization to CSV and JSON files.
-        """
-        return datetime_to_str(self.time)
 
     def __str__(self):
         """Return `str(self)`, a human-readable string representation of this object."""
@@ -144,45 +131,25 @@ class CloseApproach:
         return (f"CloseApproach(time={self.time_str!r}, distance={self.distance:.2f}, "
                 f"velocity={self.velocity:.2f}, neo={self.neo!r})")
 
-    def assign_neo(self, neos):
-        """Assign the NearEarthObject.
-
-        From input dictionary of 'neos', assign the NearEarthObject corresponding to self._designation.
-        The self CloseApproach object is added to the neo.approaches collection.
+    def csv_row(self):
+        """Serialize attributes as a CSV row, in the column order of `CSV_FIELDNAMES`.
 
-        :param neos: A dictionary of NearEarthObject's with the primary designation as key.
-        :return: Self CloseApproach object.
+        :return: A tuple with the string value of each attribute.
         """
-        if self._designation in neos:
-            self.neo = neos[self._designation]
-            self.neo.approaches.append(self)
-        else:
-            self.neo = None
-        return self
+        neo = self.neo
+        return (self.time_str, str(self.distance), str(self.velocity), neo.designation,
+                neo.name or '', str(neo.diameter), str(neo.hazardous))
 
-    def serialize(self, extension):
-        """Serialize attributes.
+    def serialize_json(self):
+        """Serialize attributes for a JSON element.
 
-        :param extension: Output structure. Must be 'csv' or 'json'.
-        :return: A dictionary containing relevant attributes for CSV or JSON serialization.
+        :return: A dictionary of the approach attributes, with the NEO attributes nested under 'neo'.
         """
-        fieldnames = ('datetime_utc', 'distance_au', 'velocity_km_s', 'designation',
-                      'name', 'diameter_km', 'potentially_hazardous')
-
-        name = self.neo.name
-        if name is None:
-            name = ''
-        attributes = (self.time_str, self.distance, self.velocity, self.neo.designation,
-                      name, self.neo.diameter, self.neo.hazardous)
-
-        if extension == 'csv':
-            attributes = (str(attr) for attr in attributes)
-            return dict(zip(fieldnames, attributes))
-
-        if extension == 'json':
-            out = dict(zip(fieldnames[:3], attributes[:3]))
-            out['neo'] = dict(zip(fieldnames[3:], attributes[3:]))
-            return out
-
-        if extension not in ('csv', 'json'):
-            raise ValueError(f"extension must be 'csv' or 'json' (given extension={extension!r}).")
+        neo = self.neo
+        return {'datetime_utc': self.time_str,
+                'distance_au': self.distance,
+                'velocity_km_s': self.velocity,
+                'neo': {'designation': neo.designation,
+                        'name': neo.name or '',
+                        'diameter_km': neo.diameter,
+                        'potentially_hazardous': neo.hazardous}}
@@ -16,7 +16,8 @@ import unittest
 
 
 from extract import load_neos, load_approaches
-from database import NEODatabase
+from database import NEODatabase, bind
+from models import NearEarthObject, CloseApproach
 
 
 # Paths to the test data files.
@@ -31,6 +32,7 @@ class TestDatabase(unittest.TestCase):
         cls.neos = load_neos(TEST_NEO_FILE)
         cls.approaches = load_approaches(TEST_CAD_FILE)
         cls.db = NEODatabase(cls.neos, cls.approaches)
+        cls.neos = cls.neos.values()
 
     def test_database_construction_links_approaches_to_neos(self):
         for approach in self.approaches:
@@ -115,5 +117,27 @@ class TestDatabase(unittest.TestCase):
         self.assertIsNone(nonexistent)
 
 
+class TestBind(unittest.TestCase):
+    def setUp(self):
+        self.linked = NearEarthObject('433', 'Eros', '16.84', 'N')
+        self.lonely = NearEarthObject('2019 SC8')
+        self.neos = {neo.designation: neo for neo in (self.linked, self.lonely)}
+        self.first = CloseApproach('433', '2020-Jan-01 00:00', '0.1', '5.0')
+        self.second = CloseApproach('433', '2020-Feb-01 00:00', '0.2', '6.0')
+        self.unmatched = CloseApproach('not-real-designation', '2020-Mar-01 00:00', '0.3', '7.0')
+        bind(self.neos, (self.first, self.unmatched, self.second))
+
+    def test_bind_links_approaches_in_order(self):
+        self.assertEqual(self.linked.approaches, [self.first, self.second])
+        self.assertIs(self.first.neo, self.linked)
+        self.assertIs(self.second.neo, self.linked)
+
+    def test_bind_unmatched_designation_keeps_no_neo(self):
+        self.assertIsNone(self.unmatched.neo)
+
+    def test_bind_neo_without_approaches_keeps_empty_collection(self):
+        self.assertEqual(self.lonely.approaches, [])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -28,7 +28,7 @@ TEST_CAD_FILE = TESTS_ROOT / 'test-cad-2020.json'
 class TestLoadNEOs(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.neos = load_neos(TEST_NEO_FILE)
+        cls.neos = load_neos(TEST_NEO_FILE).values()
         cls.neos_by_designation = {neo.designation: neo for neo in cls.neos}
 
     @classmethod
@@ -0,0 +1,68 @@
+"""Check that NASA-formatted calendar dates are converted into datetimes.
+
+The `cd_to_datetime` function uses `datetime.fromisoformat` when it's available
+(Python 3.7+) and otherwise slices the fixed-width fields itself, so both
+branches are checked against `datetime.strptime` and against malformed input.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_helpers
+
+"""
+import datetime
+import unittest
+import unittest.mock
+
+from helpers import cd_to_datetime
+
+
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Calendar dates that aren't in the fixed YYYY-bb-DD hh:mm shape, but that a bare
+# ISO 8601 or fixed-width slicing parser could accept.
+MALFORMED = ('2020-Jan-1  00:00', '2020-Jan-01T00:00', '2020-Jan-01 00',
+             '2020-Jan-01 0000', '2020-Jan-01 00:00:59', '2020-Jan-01 00:00Z',
+             '2020-Jan-01 0a:00', '2020-Jan-32 00:00', '2020-Jan-01 24:00')
+
+
+class TestCdToDatetime(unittest.TestCase):
+    def check_all_months(self):
+        for month in MONTHS:
+            calendar_date = f'2020-{month}-09 07:05'
+            with self.subTest(calendar_date=calendar_date):
+                self.assertEqual(cd_to_datetime(calendar_date),
+                                 datetime.datetime.strptime(calendar_date, '%Y-%b-%d %H:%M'))
+
+    def check_malformed(self):
+        for calendar_date in MALFORMED:
+            with self.subTest(calendar_date=calendar_date):
+                with self.assertRaises(ValueError):
+                    cd_to_datetime(calendar_date)
+
+    def test_cd_to_datetime_all_months(self):
+        self.check_all_months()
+
+    @unittest.mock.patch('helpers._fromisoformat', None)
+    def test_cd_to_datetime_all_months_without_fromisoformat(self):
+        self.check_all_months()
+
+    def test_cd_to_datetime_unknown_month_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            cd_to_datetime('2020-Foo-01 00:00')
+
+    @unittest.mock.patch('helpers._fromisoformat', None)
+    def test_cd_to_datetime_unknown_month_raises_value_error_without_fromisoformat(self):
+        with self.assertRaises(ValueError):
+            cd_to_datetime('2020-Foo-01 00:00')
+
+    def test_cd_to_datetime_malformed_raises_value_error(self):
+        self.check_malformed()
+
+    @unittest.mock.patch('helpers._fromisoformat', None)
+    def test_cd_to_datetime_malformed_raises_value_error_without_fromisoformat(self):
+        self.check_malformed()
+
+
+if __name__ == '__main__':
+    unittest.main()
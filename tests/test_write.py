@@ -36,7 +36,7 @@ TEST_CAD_FILE = TESTS_ROOT / 'test-cad-2020.json'
 
 
 def build_results(n):
-    neos = tuple(load_neos(TEST_NEO_FILE))
+    neos = load_neos(TEST_NEO_FILE)
     approaches = tuple(load_approaches(TEST_CAD_FILE))
 
     # Only needed to link together these objects.
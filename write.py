@@ -13,6 +13,8 @@ You'll edit this file in Part 4.
 import csv
 import json
 
+from models import CSV_FIELDNAMES
+
 
 def write_to_csv(results, filename):
     """Write an iterable of `CloseApproach` objects to a CSV file.
@@ -24,13 +26,10 @@ def write_to_csv(results, filename):
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should be saved.
     """
-    fieldnames = ('datetime_utc', 'distance_au', 'velocity_km_s', 'designation',
-                  'name', 'diameter_km', 'potentially_hazardous')
     with open(filename, 'w') as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in results:
-            writer.writerow(row.serialize('csv'))
+        writer = csv.writer(file)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(row.csv_row() for row in results)
 
 
 def write_to_json(results, filename):
@@ -44,8 +43,6 @@ def write_to_json(results, filename):
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should be saved.
     """
-    data = []
-    for result in results:
-        data.append(result.serialize('json'))
+    data = [result.serialize_json() for result in results]
     with open(filename, 'w') as file:
         json.dump(data, file, indent=2)